@@ -128,7 +128,7 @@ class CrawlAz(salobj.BaseScript):
 
         if current_state != salobj.State.ENABLED:
             raise RuntimeError(
-                "Dome must be in ENABLED, current state {current_state.name}."
+                f"Dome must be in ENABLED, current state {current_state.name}."
             )
 
         if self.position:
@@ -21,6 +21,8 @@
 
 __all__ = ["PrepareForOnSky"]
 
+import asyncio
+
 import yaml
 from lsst.ts import salobj
 from lsst.ts.observatory.control.maintel.lsstcam import LSSTCam, LSSTCamUsages
@@ -120,13 +122,7 @@ class PrepareForOnSky(salobj.BaseScript):
     def map_filter_value(filter_value: str) -> str:
         """Map a filter configuration value to a full filter name."""
 
-        filter_text = str(filter_value).strip()
-        filter_band_lower = filter_text.lower()
-
-        if filter_band_lower in BAND_TO_FILTER:
-            return BAND_TO_FILTER[filter_band_lower]
-
-        return filter_text
+        return BAND_TO_FILTER.get(filter_value.lower(), filter_value)
 
     async def configure_tcs(self) -> None:
         """Initialize MTCS if not already initialized."""
@@ -168,19 +164,22 @@ class PrepareForOnSky(salobj.BaseScript):
         await self.configure_camera()
         await self.configure_mtm1m3ts()
 
-        critical_cscs = self.mtcs.get_critical_components_for_prepare_for_onsky()
+        ignore = getattr(config, "ignore", None)
 
-        # Check that critical components are not ignored.
-        if hasattr(config, "ignore") and any(
-            component in critical_cscs for component in config.ignore
-        ):
-            raise ValueError(
-                "Cannot ignore critical components: {}".format(config.ignore)
+        if ignore:
+            critical_cscs = set(
+                self.mtcs.get_critical_components_for_prepare_for_onsky()
             )
 
-        if hasattr(config, "ignore"):
-            self.mtcs.disable_checks_for_components(components=config.ignore)
-            self.lsstcam.disable_checks_for_components(components=config.ignore)
+            # Check that critical components are not ignored.
+            critical_ignored = critical_cscs.intersection(ignore)
+            if critical_ignored:
+                raise ValueError(
+                    f"Cannot ignore critical components: {sorted(critical_ignored)}"
+                )
+
+            self.mtcs.disable_checks_for_components(components=ignore)
+            self.lsstcam.disable_checks_for_components(components=ignore)
 
         filter_value = getattr(config, "filter", "i_39")
         self.filter = self.map_filter_value(filter_value)
@@ -234,18 +233,21 @@ class PrepareForOnSky(salobj.BaseScript):
 
         await self.checkpoint("Preparing MTCS components for on-sky operations.")
 
-        await self.mtcs.assert_all_enabled(
-            message="All MTCS components need to be enabled to prepare for on-sky observations."
+        # Check both groups up front so a disabled camera component is
+        # reported before the MTCS preparation starts moving hardware.
+        await asyncio.gather(
+            self.mtcs.assert_all_enabled(
+                message="All MTCS components need to be enabled to prepare for on-sky observations."
+            ),
+            self.lsstcam.assert_all_enabled(
+                message="All LSSTCam components need to be enabled to prepare for on-sky observations."
+            ),
         )
 
         await self.mtcs.prepare_for_onsky(homing_attempts=self.homing_attempts)
 
         await self.checkpoint(f"Setting up LSSTCam with filter '{self.filter}'.")
 
-        await self.lsstcam.assert_all_enabled(
-            message="All LSSTCam components need to be enabled to prepare for on-sky observations."
-        )
-
         await self.lsstcam.setup_instrument(filter=self.filter)
 
         await self.checkpoint("Assert that MTM1M3TS is not in engineering mode.")
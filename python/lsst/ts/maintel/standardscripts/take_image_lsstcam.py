@@ -22,10 +22,9 @@
 __all__ = ["TakeImageLSSTCam"]
 
 import asyncio
+import math
 
-import astropy.units as u
 import yaml
-from astropy.coordinates import Angle
 from lsst.ts import salobj
 from lsst.ts.observatory.control.maintel.lsstcam import LSSTCam, LSSTCamUsages
 from lsst.ts.observatory.control.maintel.mtcs import MTCS, MTCSUsages
@@ -50,6 +49,8 @@ class TakeImageLSSTCam(BaseTakeImage):
 
     """
 
+    ACCEPTABLE_MTDOME_STATES = frozenset({salobj.State.DISABLED, salobj.State.ENABLED})
+
     def __init__(self, index):
         super().__init__(index=index, descr="Take images with LSSTCam.")
 
@@ -167,16 +168,17 @@ class TakeImageLSSTCam(BaseTakeImage):
                 set(schema_dict.get("required", [])) | set(base_schema_dict["required"])
             )
 
-        for prop in base_schema_dict["properties"]:
-            schema_dict["properties"][prop] = base_schema_dict["properties"][prop]
+        schema_dict["properties"].update(base_schema_dict["properties"])
 
         return schema_dict
 
     async def configure(self, config):
 
+        start_tasks = []
+
         if self.mtcs is None:
             self.mtcs = MTCS(self.domain, log=self.log, intended_usage=MTCSUsages.Slew)
-            await self.mtcs.start_task
+            start_tasks.append(self.mtcs.start_task)
 
         if self._lsstcam is None:
             self._lsstcam = LSSTCam(
@@ -185,34 +187,44 @@ class TakeImageLSSTCam(BaseTakeImage):
                 log=self.log,
                 tcs_ready_to_take_data=self.mtcs.ready_to_take_data,
             )
-            await self._lsstcam.start_task
+            start_tasks.append(self._lsstcam.start_task)
 
             self.instrument_setup_time = self._lsstcam.filter_change_timeout
 
-        if hasattr(config, "ignore") and config.ignore:
-            self.mtcs.disable_checks_for_components(components=config.ignore)
+        # The remotes are independent, wait for them to start concurrently.
+        await asyncio.gather(*start_tasks)
+
+        if ignore := getattr(config, "ignore", None):
+            self.mtcs.disable_checks_for_components(components=ignore)
 
         await super().configure(config=config)
 
     async def get_guider_roi(self):
         """Retrieve the guider roi from the current telescope position."""
-        try:
-            current_target = await self.mtcs.rem.mtptg.evt_currentTarget.aget(
-                timeout=self.mtcs.fast_timeout
-            )
-            target_ra_angle = Angle(current_target.ra, unit=u.rad).to(u.deg)
-            target_dec_angle = Angle(current_target.declination, unit=u.rad).to(u.deg)
-            sky_angle = Angle(current_target.rotAngle, unit=u.deg)
-            self.log.info(
-                f"Current target: ra={target_ra_angle}, dec={target_dec_angle}, sky_angle={sky_angle}."
-            )
-        except asyncio.TimeoutError:
+        current_target, current_filter = await asyncio.gather(
+            self.mtcs.rem.mtptg.evt_currentTarget.aget(timeout=self.mtcs.fast_timeout),
+            self._lsstcam.get_current_filter(),
+            return_exceptions=True,
+        )
+
+        if isinstance(current_target, asyncio.TimeoutError):
             self.log.info(
                 "Failed to retrieve current target coordinates.Continuing without guider roi."
             )
             return None
 
-        current_filter = await self._lsstcam.get_current_filter()
+        for result in (current_target, current_filter):
+            if isinstance(result, BaseException):
+                raise result
+
+        # Target ra/dec are published in radians, rotAngle in degrees.
+        target_ra = math.degrees(current_target.ra)
+        target_dec = math.degrees(current_target.declination)
+        sky_angle = current_target.rotAngle
+        self.log.info(
+            f"Current target: ra={target_ra:.6f} deg, dec={target_dec:.6f} deg, "
+            f"sky_angle={sky_angle:.6f} deg."
+        )
 
         band = current_filter[0]
 
@@ -220,10 +232,12 @@ class TakeImageLSSTCam(BaseTakeImage):
         roi_time_ms = self._lsstcam.DEFAULT_GUIDER_ROI_TIME_MS
 
         guider_rois = GuiderROIs(log=self.log)
-        roi_spec, _ = guider_rois.get_guider_rois(
-            ra=target_ra_angle.to(u.deg).value,
-            dec=target_dec_angle.to(u.deg).value,
-            sky_angle=sky_angle.to(u.deg).value,
+        # get_guider_rois is synchronous; run it off the event loop.
+        roi_spec, _ = await asyncio.to_thread(
+            guider_rois.get_guider_rois,
+            ra=target_ra,
+            dec=target_dec,
+            sky_angle=sky_angle,
             roi_size=roi_size,
             roi_time=roi_time_ms,
             band=band,
@@ -248,12 +262,23 @@ class TakeImageLSSTCam(BaseTakeImage):
         mtdometrajectory_ignored = not self.mtcs.check.mtdometrajectory
         mtdome_ignored = not self.mtcs.check.mtdome
 
-        if not mtdometrajectory_ignored:
-            dome_trajectory_evt = (
-                await self.mtcs.rem.mtdometrajectory.evt_summaryState.aget(
-                    timeout=self.mtcs.long_timeout
-                )
-            )
+        if mtdometrajectory_ignored and mtdome_ignored:
+            return None
+
+        # Gather both results before raising, so a bad MTDomeTrajectory state
+        # is reported even if the MTDome query fails.
+        dome_trajectory_evt, dome_evt = await asyncio.gather(
+            self._get_summary_state_evt(
+                self.mtcs.rem.mtdometrajectory, ignored=mtdometrajectory_ignored
+            ),
+            self._get_summary_state_evt(self.mtcs.rem.mtdome, ignored=mtdome_ignored),
+            return_exceptions=True,
+        )
+
+        if isinstance(dome_trajectory_evt, BaseException):
+            raise dome_trajectory_evt
+
+        if dome_trajectory_evt is not None:
             dome_trajectory_summary_state = salobj.State(
                 dome_trajectory_evt.summaryState
             )
@@ -265,20 +290,41 @@ class TakeImageLSSTCam(BaseTakeImage):
                     f"Current state {dome_trajectory_summary_state.name}."
                 )
 
-        if not mtdome_ignored:
-            dome_evt = await self.mtcs.rem.mtdome.evt_summaryState.aget(
-                timeout=self.mtcs.long_timeout
-            )
-            dome_summary_state = salobj.State(dome_evt.summaryState)
+        if isinstance(dome_evt, BaseException):
+            raise dome_evt
 
-            acceptable_mtdome_state = {salobj.State.DISABLED, salobj.State.ENABLED}
+        if dome_evt is not None:
+            dome_summary_state = salobj.State(dome_evt.summaryState)
 
-            if dome_summary_state not in acceptable_mtdome_state:
+            if dome_summary_state not in self.ACCEPTABLE_MTDOME_STATES:
+                acceptable_states = sorted(
+                    state.name for state in self.ACCEPTABLE_MTDOME_STATES
+                )
                 raise RuntimeError(
-                    f"MTDome must be in {acceptable_mtdome_state} before taking flats, "
+                    f"MTDome must be in {acceptable_states} before taking flats, "
                     f"current state {dome_summary_state.name}."
                 )
 
+    async def _get_summary_state_evt(self, remote, ignored):
+        """Get the summary state event of an MTCS component.
+
+        Parameters
+        ----------
+        remote : `salobj.Remote`
+            Remote of the component, e.g. ``self.mtcs.rem.mtdome``.
+        ignored : `bool`
+            Is the component ignored? If so, skip the query.
+
+        Returns
+        -------
+        `object` or `None`
+            Summary state event, or `None` if the component is ignored.
+        """
+        if ignored:
+            return None
+
+        return await remote.evt_summaryState.aget(timeout=self.mtcs.long_timeout)
+
     async def run(self):
 
         set_roi = self.config.set_roi
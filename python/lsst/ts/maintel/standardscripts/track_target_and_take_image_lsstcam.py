@@ -34,6 +34,16 @@ from lsst.ts.standardscripts.base_track_target_and_take_image import (
 )
 from lsst.ts.xml.enums.MTAOS import ClosedLoopState
 
+# MTAOS closed loop states in which it is safe to take the next exposure.
+MTAOS_IDLE_STATES = frozenset(
+    {
+        ClosedLoopState.IDLE,
+        ClosedLoopState.WAITING_IMAGE,
+        ClosedLoopState.PROCESSING,
+        ClosedLoopState.ERROR,
+    }
+)
+
 
 class CorrectionTimeoutError(Exception):
     pass
@@ -69,7 +79,6 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
         )
 
         self.angle_filter_change = 0.0
-        self.tolerance_angle_filter_change = 1e-2
 
         self.mtcs = MTCS(self.domain, intended_usage=mtcs_usage, log=self.log)
 
@@ -82,6 +91,10 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
 
         self.instrument_name = "LSSTCam"
 
+        # Filter to set up for the visit, derived from band_filter at
+        # configure time.
+        self.band_filter = None
+
     @property
     def tcs(self):
         return self.mtcs
@@ -134,6 +147,15 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
 
     async def configure(self, config):
         await super().configure(config)
+
+        # band_filter may be given as a list; LSSTCam can only be set up
+        # with a single filter, so use the first one.
+        self.band_filter = (
+            self.config.band_filter[0]
+            if isinstance(self.config.band_filter, list)
+            else self.config.band_filter
+        )
+
         try:
             await self.set_guider_roi()
         except Exception:
@@ -151,12 +173,7 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
         sky_angle = float(self.config.rot_sky)
 
         # Determine band first letter (e.g., r, i, etc.)
-        band_value = (
-            self.config.band_filter[0]
-            if isinstance(self.config.band_filter, list)
-            else self.config.band_filter
-        )
-        band = str(band_value)[0].lower()
+        band = str(self.band_filter)[0].lower()
 
         roi_size = getattr(
             self.config, "roi_size", self.lsstcam.DEFAULT_GUIDER_ROI_ROWS
@@ -166,7 +183,9 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
         )
 
         guider_rois = GuiderROIs(log=self.log)
-        roi_spec, _ = guider_rois.get_guider_rois(
+        # Run the synchronous ROI selection in a worker thread.
+        roi_spec, _ = await asyncio.to_thread(
+            guider_rois.get_guider_rois,
             ra=ra_deg,
             dec=dec_deg,
             sky_angle=sky_angle,
@@ -205,10 +224,10 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
 
         self.tracking_started = True
 
-        filter_change_required = current_filter != self.config.band_filter
+        filter_change_required = current_filter != self.band_filter
         if filter_change_required:
             self.log.debug(
-                f"Filter change required: {current_filter} -> {self.config.band_filter}"
+                f"Filter change required: {current_filter} -> {self.band_filter}"
             )
             self.lsstcam.ready_to_take_data = self.mtcs.ready_to_take_data
             await self._handle_slew_and_change_filter()
@@ -252,28 +271,7 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
             time_on_target=self.get_estimated_time_on_target(),
         )
 
-        await self.lsstcam.setup_filter(filter=self.config.band_filter)
-
-    async def _wait_rotator_reach_filter_change_angle(self):
-        """Wait until the rotator reach the filter change angle."""
-
-        while True:
-            rotator_position = await self.mtcs.rem.mtrotator.tel_rotation.next(
-                flush=True, timeout=self.mtcs.fast_timeout
-            )
-
-            if (
-                abs(rotator_position.actualPosition - self.angle_filter_change)
-                < self.tolerance_angle_filter_change
-            ):
-                self.log.debug("Rotator inside tolerance range.")
-                break
-            else:
-                self.log.debug(
-                    "Rotator not in position: "
-                    f"{rotator_position.actualPosition} -> {self.angle_filter_change}"
-                )
-                await asyncio.sleep(self.mtcs.tel_settle_time)
+        await self.lsstcam.setup_filter(filter=self.band_filter)
 
     async def take_data(self):
         """Take data while making sure MTCS is tracking."""
@@ -299,19 +297,16 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
             )
 
     async def wait_mtaos_idle(self):
-        self.mtcs.rem.mtaos.evt_closedLoopState.flush()
-        mtaos_closed_loop_state = await self.mtcs.rem.mtaos.evt_closedLoopState.aget(
+        evt_closed_loop_state = self.mtcs.rem.mtaos.evt_closedLoopState
+
+        evt_closed_loop_state.flush()
+        mtaos_closed_loop_state = await evt_closed_loop_state.aget(
             timeout=self.mtcs.long_timeout
         )
         self.log.info(
             f"MTAOS closed loop state: {ClosedLoopState(mtaos_closed_loop_state.state).name}."
         )
-        while mtaos_closed_loop_state.state not in {
-            ClosedLoopState.IDLE,
-            ClosedLoopState.WAITING_IMAGE,
-            ClosedLoopState.PROCESSING,
-            ClosedLoopState.ERROR,
-        }:
+        while mtaos_closed_loop_state.state not in MTAOS_IDLE_STATES:
             try:
                 if mtaos_closed_loop_state.state == ClosedLoopState.WAITING_APPLY:
                     self.log.info(
@@ -323,10 +318,8 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
                             timeout=self.mtcs.long_timeout, wait_settle=False
                         )
 
-                mtaos_closed_loop_state = (
-                    await self.mtcs.rem.mtaos.evt_closedLoopState.next(
-                        flush=False, timeout=self.mtcs.long_timeout
-                    )
+                mtaos_closed_loop_state = await evt_closed_loop_state.next(
+                    flush=False, timeout=self.mtcs.long_timeout
                 )
                 self.log.info(
                     f"MTAOS closed loop state: {ClosedLoopState(mtaos_closed_loop_state.state).name}."
@@ -343,9 +336,7 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
         mtaos_closed_loop_state = await self.mtcs.rem.mtaos.evt_closedLoopState.aget(
             timeout=self.mtcs.long_timeout
         )
-        while mtaos_closed_loop_state.state not in {
-            ClosedLoopState.WAITING_IMAGE,
-        }:
+        while mtaos_closed_loop_state.state != ClosedLoopState.WAITING_IMAGE:
             try:
                 mtaos_closed_loop_state = (
                     await self.mtcs.rem.mtaos.evt_closedLoopState.next(
@@ -441,13 +432,12 @@ class TrackTargetAndTakeImageLSSTCam(BaseTrackTargetAndTakeImage):
             f"Waiting for degree of freedom for {visit_id=} ({visit_id_index=}); "
             f"got initial {degree_of_freedom_visit_id_index}."
         )
+        next_timeout = self.mtcs.long_long_timeout + self.config.exp_times[0] * 2.0
         while degree_of_freedom_visit_id_index <= visit_id_index:
             try:
                 degree_of_freedom = await self.mtcs.rem.mtaos.evt_degreeOfFreedom.next(
                     flush=False,
-                    timeout=(
-                        self.mtcs.long_long_timeout + self.config.exp_times[0] * 2.0
-                    ),
+                    timeout=next_timeout,
                 )
             except TimeoutError as e:
                 raise CorrectionTimeoutError(
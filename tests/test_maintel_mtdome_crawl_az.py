@@ -200,6 +200,23 @@ class TestCrawlAz(standardscripts.BaseScriptTestCase, unittest.IsolatedAsyncioTe
                 timeout=self.script.TIMEOUT_CMD,
             )
 
+    async def test_run_dome_not_enabled(self):
+        async def get_mtdome_summary_state_disabled(timeout=0.0, flush=False):
+            return SimpleNamespace(summaryState=salobj.State.DISABLED.value)
+
+        async with self.make_script():
+            await self.configure_script()
+
+            self.script.mtcs.rem.mtdome.evt_summaryState.aget.side_effect = (
+                get_mtdome_summary_state_disabled
+            )
+
+            with pytest.raises(RuntimeError, match="current state DISABLED"):
+                await self.script.run()
+
+            self.script.mtcs.slew_dome_to.assert_not_awaited()
+            self.script.mtcs.rem.mtdome.cmd_crawlAz.set_start.assert_not_awaited()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -117,6 +117,16 @@ class TestPrepareForOnSky(
                 with self.assertRaises(salobj.ExpectedError):
                     await self.configure_script(ignore=["mtm1m3", "mtm2", "mtptg"])
 
+    async def test_configure_ignore_critical_components_message(self):
+        async with self.make_script():
+            # Only the critical components are reported, non-critical
+            # components in the same ignore list are left out.
+            with self.assertRaisesRegex(
+                salobj.ExpectedError,
+                r"Cannot ignore critical components: \['mtmount'\]",
+            ):
+                await self.configure_script(ignore=["mtdometrajectory", "mtmount"])
+
     async def test_run(self):
         async with self.make_script():
             await self.configure_script()
@@ -134,6 +144,26 @@ class TestPrepareForOnSky(
             self.script.mtcs.prepare_for_onsky.assert_called_once()
             self.script.lsstcam.setup_instrument.assert_called_once_with(filter="i_39")
 
+    async def test_run_lsstcam_not_enabled(self):
+        """Test the script fails before preparing MTCS when LSSTCam is not
+        enabled."""
+        async with self.make_script():
+            await self.configure_script()
+
+            self.script.mtcs.assert_all_enabled = unittest.mock.AsyncMock()
+            self.script.lsstcam.assert_all_enabled = unittest.mock.AsyncMock(
+                side_effect=RuntimeError("LSSTCam components not enabled.")
+            )
+            self.script.mtcs.prepare_for_onsky = unittest.mock.AsyncMock()
+            self.script.lsstcam.setup_instrument = unittest.mock.AsyncMock()
+
+            with self.assertRaises(AssertionError):
+                await self.run_script()
+
+            self.script.lsstcam.assert_all_enabled.assert_awaited_once()
+            self.script.mtcs.prepare_for_onsky.assert_not_awaited()
+            self.script.lsstcam.setup_instrument.assert_not_awaited()
+
     async def test_run_ignore_non_critical_components(self):
         async with self.make_script():
             await self.configure_script(ignore=["mtdometrajectory"])
@@ -19,6 +19,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import math
+import types
 import unittest
 import unittest.mock as mock
 
@@ -85,6 +88,19 @@ class TestTakeImageLSSTCam(
             with pytest.raises(RuntimeError, match="MTDomeTrajectory must be ENABLED"):
                 await self.script.assert_feasibility()
 
+    async def test_assert_feasibility_flats_bad_dome_trajectory_dome_timeout(self):
+        """Test that a bad MTDomeTrajectory state is reported even if the
+        MTDome summary state query times out"""
+        async with self.make_script():
+            await self.configure_script(exp_times=1, image_type="FLAT")
+            await self._inject_mtcs_check_mocks()
+            await self._set_summary_states(salobj.State.DISABLED, salobj.State.ENABLED)
+            self.script.mtcs.rem.mtdome.evt_summaryState.aget = mock.AsyncMock(
+                side_effect=asyncio.TimeoutError()
+            )
+            with pytest.raises(RuntimeError, match="MTDomeTrajectory must be ENABLED"):
+                await self.script.assert_feasibility()
+
     async def test_assert_feasibility_flats_bad_dome(self):
         """Test that feasibility check fails when MTDome is in invalid
         state"""
@@ -210,6 +226,95 @@ class TestTakeImageLSSTCam(
             self.script.get_guider_roi.assert_awaited_once()
             self.script.camera.reset_guider_roi.assert_not_called()
 
+    async def _set_guider_roi_mocks(self, current_target, current_filter):
+        """Set up mocks for the current target and filter queries"""
+        self.script.mtcs.fast_timeout = 5.0
+        self.script.mtcs.rem.mtptg.evt_currentTarget.aget = mock.AsyncMock(
+            side_effect=[current_target]
+        )
+        self.script._lsstcam.get_current_filter = mock.AsyncMock(
+            side_effect=[current_filter]
+        )
+        self.script._lsstcam.DEFAULT_GUIDER_ROI_ROWS = 400
+        self.script._lsstcam.DEFAULT_GUIDER_ROI_TIME_MS = 200
+
+    async def test_get_guider_roi(self):
+        """Test that the current target is passed to the ROI selection in
+        degrees."""
+        async with self.make_script():
+            await self.configure_script(exp_times=1, image_type="OBJECT")
+            await self._set_guider_roi_mocks(
+                current_target=types.SimpleNamespace(
+                    ra=math.radians(150.0),
+                    declination=math.radians(-10.0),
+                    rotAngle=30.0,
+                ),
+                current_filter="r_57",
+            )
+            captured_params = {}
+
+            class DummyGuiderROIs:
+                def __init__(self, log=None):
+                    pass
+
+                def get_guider_rois(self, ra, dec, sky_angle, band, **kwargs):
+                    captured_params.update(
+                        ra=ra, dec=dec, sky_angle=sky_angle, band=band
+                    )
+                    return mock.sentinel.roi_spec, None
+
+            with mock.patch(
+                "lsst.ts.maintel.standardscripts.take_image_lsstcam.GuiderROIs",
+                DummyGuiderROIs,
+            ):
+                roi_spec = await self.script.get_guider_roi()
+
+            assert roi_spec is mock.sentinel.roi_spec
+            assert isinstance(captured_params["ra"], float)
+            assert isinstance(captured_params["dec"], float)
+            assert captured_params["ra"] == pytest.approx(150.0)
+            assert captured_params["dec"] == pytest.approx(-10.0)
+            assert captured_params["sky_angle"] == pytest.approx(30.0)
+            assert captured_params["band"] == "r"
+
+    async def test_get_guider_roi_current_target_timeout(self):
+        """Test that no ROI is returned when the current target is not
+        available."""
+        async with self.make_script():
+            await self.configure_script(exp_times=1, image_type="OBJECT")
+            await self._set_guider_roi_mocks(
+                current_target=asyncio.TimeoutError(),
+                current_filter="r_57",
+            )
+
+            with mock.patch(
+                "lsst.ts.maintel.standardscripts.take_image_lsstcam.GuiderROIs"
+            ) as guider_rois:
+                assert await self.script.get_guider_roi() is None
+
+            guider_rois.assert_not_called()
+
+    async def test_get_guider_roi_filter_error(self):
+        """Test that a failure to get the current filter is raised."""
+        async with self.make_script():
+            await self.configure_script(exp_times=1, image_type="OBJECT")
+            await self._set_guider_roi_mocks(
+                current_target=types.SimpleNamespace(
+                    ra=math.radians(150.0),
+                    declination=math.radians(-10.0),
+                    rotAngle=30.0,
+                ),
+                current_filter=RuntimeError("Failed to get current filter."),
+            )
+
+            with mock.patch(
+                "lsst.ts.maintel.standardscripts.take_image_lsstcam.GuiderROIs"
+            ) as guider_rois:
+                with pytest.raises(RuntimeError, match="Failed to get current filter."):
+                    await self.script.get_guider_roi()
+
+            guider_rois.assert_not_called()
+
     def test_schema_inherits_base_required(self):
         """Test that the schema inherits 'required' fields from the base class.
 
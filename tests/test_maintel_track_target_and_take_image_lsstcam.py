@@ -259,6 +259,32 @@ class TestMainTelTrackTargetAndTakeImageLSSTCam(
 
             self.script.mtcs.stop_tracking.assert_not_awaited()
 
+    async def test_run_already_in_filter_band_filter_list(self):
+        async with self.make_script(), self.setup_mocks():
+            self.script.mtcs.check_tracking.side_effect = (
+                self.check_tracking_forever_side_effect
+            )
+
+            configuration_full = await self.configure_script_full(
+                band_filter=["r", "i"]
+            )
+
+            assert self.script.band_filter == "r"
+
+            await self.run_script()
+
+            self.script.mtcs.slew_icrs.assert_awaited_once_with(
+                ra=configuration_full["ra"],
+                dec=configuration_full["dec"],
+                rot=configuration_full["rot_sky"],
+                rot_type=RotType.Sky,
+                target_name=configuration_full["name"],
+                az_wrap_strategy=self.script.config.az_wrap_strategy,
+                time_on_target=self.script.get_estimated_time_on_target(),
+            )
+            self.script.lsstcam.setup_filter.assert_not_awaited()
+            assert self.script.lsstcam.ready_to_take_data is None
+
     async def test_configure_init_guider_called_with_selected_roi(self):
         async with self.make_script(), self.setup_mocks():
             # Patch GuiderROIs inside the script module to return a